@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 import pathlib
+import re
 
 import setuptools
 
@@ -7,11 +8,10 @@ import setuptools
 def read_version():
     root_path = pathlib.Path(__file__).parent
     version_path = root_path / "uqbar" / "_version.py"
-    with version_path.open() as file_pointer:
-        file_contents = file_pointer.read()
-    local_dict = {}
-    exec(file_contents, None, local_dict)
-    return local_dict["__version__"]
+    match = re.search(r"__version_info__\s*=\s*\(([^)]*)\)", version_path.read_text())
+    if match is None:
+        raise RuntimeError(f"Unable to find __version_info__ in {version_path}")
+    return ".".join(part.strip() for part in match.group(1).split(",") if part.strip())
 
 
 if __name__ == "__main__":
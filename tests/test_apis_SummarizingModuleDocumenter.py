@@ -342,3 +342,62 @@ def test_str_03(test_path):
         .. autofunction:: public_function
         """
     )
+
+
+def test_member_documenters_by_section(test_path):
+    documenter = uqbar.apis.SummarizingModuleDocumenter("fake_package.module")
+    by_section = documenter.member_documenters_by_section
+    assert [section for section, _ in by_section] == ["Classes", "Functions"]
+    assert documenter.member_documenters_by_section is by_section
+    assert normalize(str(documenter)) == normalize(
+        """
+        .. _fake-package--module:
+
+        module
+        ======
+
+        .. automodule:: fake_package.module
+
+        .. currentmodule:: fake_package.module
+
+        .. container:: svg-container
+
+           .. inheritance-diagram:: fake_package
+              :lineage: fake_package.module
+
+        .. raw:: html
+
+           <hr/>
+
+        .. rubric:: Classes
+           :class: section-header
+
+        .. autosummary::
+           :nosignatures:
+
+           ~ChildClass
+           ~PublicClass
+
+        .. autoclass:: ChildClass
+           :members:
+           :undoc-members:
+
+        .. autoclass:: PublicClass
+           :members:
+           :undoc-members:
+
+        .. raw:: html
+
+           <hr/>
+
+        .. rubric:: Functions
+           :class: section-header
+
+        .. autosummary::
+           :nosignatures:
+
+           ~public_function
+
+        .. autofunction:: public_function
+        """
+    )
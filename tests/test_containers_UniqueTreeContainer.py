@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 import uqbar.containers
@@ -24,6 +26,25 @@ class TestCase(unittest.TestCase):
         assert node.depth == 0
         assert len(node) == 0
 
+    def test___init___03(self):
+        """
+        Initialize with children.
+        """
+        node_a = uqbar.containers.UniqueTreeList()
+        node_b = uqbar.containers.UniqueTreeNode(name="foo")
+        node_c = uqbar.containers.UniqueTreeNode()
+        node_a.extend([node_b, node_c])
+        node_d = uqbar.containers.UniqueTreeList(children=[node_c, node_b])
+        assert node_d[:] == [node_c, node_b]
+        assert node_b.parent is node_d
+        assert node_c.parent is node_d
+        assert len(node_a) == 0
+        assert "foo" in node_d
+        assert "foo" not in node_a
+        assert node_d.index(node_b) == 1
+        with self.assertRaises(ValueError):
+            uqbar.containers.UniqueTreeList(children=[object()])
+
     def test_append_01(self):
         """
         Unique parentage.
@@ -63,6 +84,80 @@ class TestCase(unittest.TestCase):
         assert node_b in node_a
         assert node_c in node_a
 
+    def test_children(self):
+        """
+        Children are returned as a tuple, refreshed after mutation.
+        """
+        node_a = uqbar.containers.UniqueTreeList()
+        node_b = uqbar.containers.UniqueTreeNode()
+        node_c = uqbar.containers.UniqueTreeNode()
+        assert node_a.children == ()
+        node_a.append(node_b)
+        children = node_a.children
+        assert children == (node_b,)
+        assert node_a.children is children
+        node_a.append(node_c)
+        assert node_a.children == (node_b, node_c)
+        uqbar.containers.UniqueTreeList(children=[node_b])
+        assert node_a.children == (node_c,)
+
+    def test_depth_first(self):
+        """
+        Depth-first traversal, with and without snapshotting children.
+        """
+        node_a = uqbar.containers.UniqueTreeList(name="a")
+        node_b = uqbar.containers.UniqueTreeList(name="b")
+        node_c = uqbar.containers.UniqueTreeNode(name="c")
+        node_d = uqbar.containers.UniqueTreeNode(name="d")
+        node_e = uqbar.containers.UniqueTreeNode(name="e")
+        node_a.extend([node_b, node_e])
+        node_b.extend([node_c, node_d])
+        assert [x.name for x in node_a.depth_first()] == ["b", "c", "d", "e"]
+        assert [x.name for x in node_a.depth_first(snapshot=False)] == [
+            "b",
+            "c",
+            "d",
+            "e",
+        ]
+        assert [x.name for x in node_a.depth_first(top_down=False)] == [
+            "c",
+            "d",
+            "b",
+            "e",
+        ]
+        for node in node_a.depth_first(top_down=False):
+            node.parent.remove(node)
+        assert len(node_a) == 0
+        assert len(node_b) == 0
+
+    def test_depth_first_deep(self):
+        """
+        Depth-first traversal does not recurse.
+        """
+        root = uqbar.containers.UniqueTreeList()
+        node = root
+        for _ in range(1500):
+            child = uqbar.containers.UniqueTreeList()
+            node.append(child)
+            node = child
+        assert list(root.depth_first())[-1] is node
+        assert list(root.depth_first(top_down=False))[0] is node
+
+    def test_recurse(self):
+        """
+        Recursion is a top-down depth-first traversal, for lists and dicts.
+        """
+        node_a = uqbar.containers.UniqueTreeDict()
+        node_b = uqbar.containers.UniqueTreeList()
+        node_c = uqbar.containers.UniqueTreeNode()
+        node_a["b"] = node_b
+        node_b.append(node_c)
+        assert list(node_a.recurse()) == [node_b, node_c]
+        assert list(node_a.recurse(prototype=uqbar.containers.UniqueTreeList)) == [
+            node_b
+        ]
+        assert list(node_b.recurse()) == [node_c]
+
     def test_extend_01(self):
         """
         Extend from a list.
@@ -105,6 +200,50 @@ class TestCase(unittest.TestCase):
         assert node_d in node_b
         assert node_d not in node_a
 
+    def test_extend_03(self):
+        """
+        Extend with a node and one of its own descendants.
+        """
+        root = uqbar.containers.UniqueTreeList(name="root")
+        node_a = uqbar.containers.UniqueTreeList(name="a")
+        node_b = uqbar.containers.UniqueTreeNode(name="b")
+        node_a.append(node_b)
+        root.extend([node_a, node_b])
+        assert root[:] == [node_a, node_b]
+        assert node_a[:] == []
+        assert node_a.parent is root
+        assert node_b.parent is root
+        assert root["a"] is node_a
+        assert root["b"] is node_b
+        assert "b" not in node_a
+        node_c = uqbar.containers.UniqueTreeList(name="c")
+        node_d = uqbar.containers.UniqueTreeNode(name="d")
+        node_c.append(node_d)
+        node_e = uqbar.containers.UniqueTreeList(children=[node_c, node_d])
+        assert node_e[:] == [node_c, node_d]
+        assert node_c[:] == []
+        assert node_e["d"] is node_d
+
+    def test_extend_04(self):
+        """
+        Extend with a container sharing its name with one of its descendants.
+        """
+        node_a = uqbar.containers.UniqueTreeList()
+        node_b = uqbar.containers.UniqueTreeList(name="c")
+        node_c = uqbar.containers.UniqueTreeNode(name="c")
+        node_a.append(node_b)
+        node_b.append(node_c)
+        node_d = uqbar.containers.UniqueTreeList()
+        node_d.extend([node_b, node_c])
+        node_e = uqbar.containers.UniqueTreeList()
+        node_d.append(node_e)
+        node_e.extend([node_a, node_b])
+        assert node_e[:] == [node_a, node_b]
+        assert node_b.parent is node_e
+        assert node_d[:] == [node_c, node_e]
+        assert node_e["c"] is node_b
+        assert "c" not in node_a
+
     def test_forbid_circular_parentage(self):
         """
         Cannot insert a parent as a child.
@@ -156,6 +295,25 @@ class TestCase(unittest.TestCase):
         assert node_a["baz"] is node_c
         assert node_a["quux"] == [node_d, node_e]
 
+    def test___getitem___named_moved(self):
+        """
+        Named lookups follow nodes moved between parents in bulk.
+        """
+        node_a = uqbar.containers.UniqueTreeList(name="foo")
+        node_b = uqbar.containers.UniqueTreeList(name="bar")
+        node_c = uqbar.containers.UniqueTreeList(name="baz")
+        node_d = uqbar.containers.UniqueTreeNode(name="quux")
+        node_e = uqbar.containers.UniqueTreeNode(name="quux")
+        node_a.extend([node_b, node_c])
+        node_b.extend([node_d, node_e])
+        node_c.extend([node_d, node_e])
+        assert node_a["quux"] == [node_d, node_e]
+        assert "quux" not in node_b
+        assert node_c["quux"] == [node_d, node_e]
+        node_c[:] = []
+        assert "quux" not in node_a
+        assert "quux" not in node_c
+
     def test___iter__(self):
         """
         UniqueTreeList can be iterated.
@@ -213,6 +371,37 @@ class TestCase(unittest.TestCase):
         node_a[:] = []
         assert node_a[:] == []
 
+    def test___contains__(self):
+        """
+        Containment tracks identity and names across mutation.
+        """
+        node_a = uqbar.containers.UniqueTreeList()
+        node_b = uqbar.containers.UniqueTreeNode(name="foo")
+        node_c = uqbar.containers.UniqueTreeNode()
+        node_a.extend([node_b, node_c])
+        assert node_b in node_a
+        assert node_c in node_a
+        assert "foo" in node_a
+        node_a[0] = node_c
+        assert node_b not in node_a
+        assert node_c in node_a
+        assert "foo" not in node_a
+        del node_a[:]
+        assert node_c not in node_a
+
+    def test___deepcopy__(self):
+        """
+        Copies index their own children.
+        """
+        node_a = uqbar.containers.UniqueTreeList()
+        node_b = uqbar.containers.UniqueTreeNode()
+        node_c = uqbar.containers.UniqueTreeNode()
+        node_a.extend([node_b, node_c])
+        for copied in (copy.deepcopy(node_a), pickle.loads(pickle.dumps(node_a))):
+            assert copied.index(copied[1]) == 1
+            assert copied[0] in copied
+            assert node_b not in copied
+
     def test___delitem___01(self):
         """
         Nodes can be deleted.
@@ -242,6 +431,95 @@ class TestCase(unittest.TestCase):
         assert node_d.parent is None
         assert node_e.parent is None
 
+    def test_index(self):
+        """
+        Indices follow insertions, removals and re-insertions.
+        """
+        node_a = uqbar.containers.UniqueTreeList()
+        node_b = uqbar.containers.UniqueTreeNode()
+        node_c = uqbar.containers.UniqueTreeNode()
+        node_d = uqbar.containers.UniqueTreeNode()
+        node_a.extend([node_b, node_c, node_d])
+        assert [node_a.index(x) for x in (node_b, node_c, node_d)] == [0, 1, 2]
+        node_a.append(node_b)
+        assert [node_a.index(x) for x in (node_c, node_d, node_b)] == [0, 1, 2]
+        node_a.remove(node_c)
+        assert [node_a.index(x) for x in (node_d, node_b)] == [0, 1]
+        with self.assertRaises(ValueError):
+            node_a.index(node_c)
+
+    def test_index_after_mutation(self):
+        """
+        Indices stay correct through front insertions, bulk removals and
+        moves to another list, however often they are looked up in between.
+        """
+        node_a = uqbar.containers.UniqueTreeList()
+        node_b = uqbar.containers.UniqueTreeList()
+        nodes = [uqbar.containers.UniqueTreeNode() for _ in range(6)]
+        for node in nodes:
+            node_a.insert(0, node)
+        nodes.reverse()
+        assert node_a[:] == nodes
+        for _ in range(3):
+            assert [node_a.index(x) for x in nodes] == list(range(6))
+        del node_a[1:3]
+        del nodes[1:3]
+        assert [node_a.index(x) for x in nodes] == list(range(4))
+        node_b.append(nodes.pop(1))
+        assert node_a.index(nodes[2]) == 2
+        assert [node_a.index(x) for x in nodes] == list(range(3))
+        node_a[:] = reversed(node_a)
+        nodes.reverse()
+        assert [node_a.index(x) for x in nodes] == list(range(3))
+        assert [node_a.pop(0) for _ in range(3)] == nodes
+        assert len(node_a) == 0
+
+    def test_index_by_identity(self):
+        """
+        Children are found by identity, even if nodes compare equal.
+        """
+
+        class EqualNode(uqbar.containers.UniqueTreeNode):
+            __hash__ = uqbar.containers.UniqueTreeNode.__hash__
+
+            def __eq__(self, other):
+                return True
+
+        node_a = uqbar.containers.UniqueTreeList()
+        node_b = uqbar.containers.UniqueTreeList()
+        node_c, node_d, node_e = EqualNode(), EqualNode(), EqualNode()
+        node_a.extend([node_c, node_d])
+        node_a.insert(0, node_e)
+        assert node_a.index(node_d) == 2
+        assert node_a.index(node_c) == 1
+        node_b.append(node_c)
+        assert node_a[0] is node_e
+        assert node_a[1] is node_d
+        node_a.insert(0, node_c)
+        node_a.remove(node_d)
+        assert [node_a.index(x) for x in (node_c, node_e)] == [0, 1]
+        assert node_a[1] is node_e
+
+    def test_mark_entire_tree_for_later_update(self):
+        """
+        Only mutations which change children mark the tree.
+        """
+
+        class FlaggedList(uqbar.containers.UniqueTreeList):
+            _state_flag_names = ("_is_current",)
+
+        node_a = FlaggedList()
+        node_b = uqbar.containers.UniqueTreeNode()
+        node_a._is_current = True
+        node_a[0:0] = []
+        del node_a[0:0]
+        assert node_a._is_current
+        node_a.append(node_b)
+        assert not node_a._is_current
+        node_a._is_current = True
+        del node_a[0]
+        assert not node_a._is_current
+
     def test_pop(self):
         """
         Nodes can be popped.
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 import uqbar.graphs
@@ -45,3 +47,61 @@ class TestCase(unittest.TestCase):
                 shape=oval];
             """
         )
+
+    def test___deepcopy__(self):
+        attributes = uqbar.graphs.Attributes(
+            mode="node", color="blue", style=["rounded", "filled"]
+        )
+        assert not hasattr(attributes, "__dict__")
+        for copied in (
+            copy.deepcopy(attributes),
+            pickle.loads(pickle.dumps(attributes)),
+        ):
+            assert copied == attributes
+            assert copied.mode is attributes.mode
+
+    def test___init___cached(self):
+        attributes_a = uqbar.graphs.Attributes(mode="node", fontsize=1, label=1)
+        attributes_b = uqbar.graphs.Attributes(mode="node", fontsize=1, label=1)
+        assert attributes_a == attributes_b
+        attributes_a["color"] = "red"
+        assert "color" not in attributes_b
+        attributes_c = uqbar.graphs.Attributes(mode="node", label=True)
+        assert attributes_c["label"] == "True"
+        # Color and Point are mutable, so converted values are never shared
+        attributes_d = uqbar.graphs.Attributes(mode="node", color="red", pos="12")
+        attributes_e = uqbar.graphs.Attributes(mode="node", color="red", pos="12")
+        assert attributes_d["color"] is not attributes_e["color"]
+        assert attributes_d["pos"] is not attributes_e["pos"]
+        attributes_d["color"].color = "blue"
+        attributes_f = uqbar.graphs.Attributes(mode="node", color="red", pos="12")
+        assert attributes_e["color"] == uqbar.graphs.Attributes.Color("red")
+        assert attributes_f["color"] == uqbar.graphs.Attributes.Color("red")
+
+    def test_copy(self):
+        attributes = uqbar.graphs.Attributes(
+            mode="node", color="blue", style=["rounded", "filled"]
+        )
+        copied = attributes.copy()
+        assert copied == attributes
+        assert type(copied) is type(attributes)
+        copied["shape"] = "oval"
+        assert "shape" not in attributes
+
+    def test___init___invalid(self):
+        with self.assertRaises(ValueError):
+            uqbar.graphs.Attributes(mode="node", shape="not-a-shape")
+        with self.assertRaises(ValueError):
+            uqbar.graphs.Attributes(mode="node", style=["rounded", "not-a-style"])
+        with self.assertRaises(ValueError):
+            uqbar.graphs.Attributes(mode="edge", color=[])
+
+    def test_mapping_methods(self):
+        attributes = uqbar.graphs.Attributes(mode="node", fontsize=11.5, shape="oval")
+        assert "shape" in attributes
+        assert "color" not in attributes
+        assert attributes.get("shape") == "oval"
+        assert attributes.get("color", "black") == "black"
+        assert sorted(attributes.keys()) == ["fontsize", "shape"]
+        assert sorted(attributes.items()) == [("fontsize", 11.5), ("shape", "oval")]
+        assert sorted(attributes.values(), key=str) == [11.5, "oval"]
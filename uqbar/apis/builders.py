@@ -218,7 +218,7 @@ class APIBuilder(object):
                 title=self._title,
             )
         # Yield module documenters, top-down.
-        for node in root_node.depth_first():
+        for node in root_node.depth_first(snapshot=False):
             if node is not root_node:
                 yield node.documenter
 
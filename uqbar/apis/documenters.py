@@ -1,9 +1,11 @@
+import collections
 import enum
 import importlib
 import inspect
 import pathlib
+import sys
 import types
-from typing import List, MutableMapping, Optional, Sequence, Tuple, Type, cast
+from typing import Dict, List, Optional, Sequence, Tuple, Type, cast
 
 
 class MemberDocumenter:
@@ -37,12 +39,13 @@ class MemberDocumenter:
 
     def __init__(self, package_path: str) -> None:
         module_path, _, client_name = package_path.rpartition(".")
-        module = importlib.import_module(module_path)
+        module = sys.modules.get(module_path) or importlib.import_module(module_path)
         client = getattr(module, client_name)
         if not self.validate_client(client, module_path):
             message = f"Unexpected object: {client!r} from {module_path}"
             raise ValueError(message)
         self._client = client
+        self._client_module = getattr(client, "__module__", None)
         self._package_path = package_path
 
     ### SPECIAL METHODS ###
@@ -289,6 +292,9 @@ class ModuleDocumenter:
             module_documenters = tuple(module_documenters)
         self._module_documenters = module_documenters or ()
         self._member_documenters = self._populate()
+        self._member_documenters_by_section: Optional[
+            Sequence[Tuple[str, Sequence[MemberDocumenter]]]
+        ] = None
 
     ### SPECIAL METHODS ###
 
@@ -404,10 +410,13 @@ class ModuleDocumenter:
     def member_documenters_by_section(
         self,
     ) -> Sequence[Tuple[str, Sequence[MemberDocumenter]]]:
-        result: MutableMapping[str, List[MemberDocumenter]] = {}
+        if self._member_documenters_by_section is not None:
+            return self._member_documenters_by_section
+        result: Dict[str, List[MemberDocumenter]] = collections.defaultdict(list)
         for documenter in self.member_documenters:
-            result.setdefault(documenter.documentation_section, []).append(documenter)
-        return sorted(result.items())
+            result[documenter.documentation_section].append(documenter)
+        self._member_documenters_by_section = sorted(result.items())
+        return self._member_documenters_by_section
 
     @property
     def module_documenters(self) -> Sequence["ModuleDocumenter"]:
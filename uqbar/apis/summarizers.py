@@ -1,7 +1,8 @@
+import collections
 import enum
 import inspect
 import textwrap
-from typing import List, MutableMapping, Tuple, cast
+from typing import Dict, Iterator, List, Tuple, cast
 from unittest import mock
 
 from sphinx.ext.autosummary import extract_summary  # type: ignore
@@ -15,6 +16,12 @@ from .documenters import (
     RootDocumenter,
 )
 
+_AUTOSUMMARY_HEADER = ("", ".. autosummary::", "   :nosignatures:", "")
+
+_HR = ("", ".. raw:: html", "", "   <hr/>", "")
+
+_TOC_HEADER = ("", ".. toctree::", "   :hidden:", "")
+
 
 class SummarizingClassDocumenter(ClassDocumenter):
     """
@@ -404,63 +411,7 @@ class SummarizingModuleDocumenter(ModuleDocumenter):
     ### SPECIAL METHODS ###
 
     def __str__(self) -> str:
-        result = self._build_preamble()
-        package_path = self.package_path.partition(".")[0]
-        lineage_path = self.package_path
-        result.extend(
-            [
-                "",
-                ".. container:: svg-container",
-                "",
-                "   .. inheritance-diagram:: {}".format(package_path),
-                "      :lineage: {}".format(lineage_path),
-            ]
-        )
-        if self.is_nominative:
-            result.extend(["", str(self.member_documenters[0])])
-        else:
-            if self.is_package:
-                subpackage_documenters = [
-                    _
-                    for _ in self.module_documenters or []
-                    if _.is_package or not _.is_nominative
-                ]
-                if subpackage_documenters:
-                    result.extend(
-                        [
-                            "",
-                            ".. raw:: html",
-                            "",
-                            "   <hr/>",
-                            "",
-                            ".. rubric:: Subpackages",
-                            "   :class: section-header",
-                        ]
-                    )
-                    result.extend(
-                        self._build_toc(subpackage_documenters, show_full_paths=True)
-                    )
-            for section, documenters in self.member_documenters_by_section:
-                result.extend(
-                    [
-                        "",
-                        ".. raw:: html",
-                        "",
-                        "   <hr/>",
-                        "",
-                        ".. rubric:: {}".format(section),
-                        "   :class: section-header",
-                    ]
-                )
-                local_documenters = [
-                    documenter
-                    for documenter in documenters
-                    if documenter.client.__module__ == self.package_path
-                ]
-                result.extend(self._build_toc(documenters))
-                for local_documenter in local_documenters:
-                    result.extend(["", str(local_documenter)])
-        return "\n".join(result)
+        return "\n".join(self._iter_lines())
 
     ### PRIVATE METHODS ###
 
@@ -470,37 +421,75 @@ class SummarizingModuleDocumenter(ModuleDocumenter):
         result: List[str] = []
         if not documenters:
             return result
-        toctree_paths = set()
-        for documenter in documenters:
-            path = self._build_toc_path(documenter)
-            if path:
-                toctree_paths.add(path)
+        toctree_paths = sorted(
+            {path for path in map(self._build_toc_path, documenters) if path}
+        )
         if toctree_paths:
-            result.extend(["", ".. toctree::", "   :hidden:", ""])
-            for toctree_path in sorted(toctree_paths):
+            result.extend(_TOC_HEADER)
+            for toctree_path in toctree_paths:
                 result.append("   {}".format(toctree_path))
-        result.extend(["", ".. autosummary::", "   :nosignatures:", ""])
+        result.extend(_AUTOSUMMARY_HEADER)
+        template = "   {}" if show_full_paths else "   ~{}"
+        prefix = self.package_path + "."
         for documenter in documenters:
-            template = "   ~{}"
-            if show_full_paths:
-                template = "   {}"
-            path = documenter.package_path.rpartition(self.package_path + ".")[-1]
+            path = documenter.package_path
+            if path.startswith(prefix):
+                path = path[len(prefix) :]
             result.append(template.format(path))
         return result
 
+    def _iter_lines(self) -> Iterator[str]:
+        package_path = self.package_path
+        yield from self._build_preamble()
+        yield ""
+        yield ".. container:: svg-container"
+        yield ""
+        yield "   .. inheritance-diagram:: {}".format(package_path.partition(".")[0])
+        yield "      :lineage: {}".format(package_path)
+        if self.is_nominative:
+            yield ""
+            yield str(self.member_documenters[0])
+            return
+        if self.is_package:
+            subpackage_documenters = [
+                _
+                for _ in self.module_documenters or []
+                if _.is_package or not _.is_nominative
+            ]
+            if subpackage_documenters:
+                yield from _HR
+                yield ".. rubric:: Subpackages"
+                yield "   :class: section-header"
+                yield from self._build_toc(subpackage_documenters, show_full_paths=True)
+        for section, documenters in self.member_documenters_by_section:
+            yield from _HR
+            yield ".. rubric:: {}".format(section)
+            yield "   :class: section-header"
+            yield from self._build_toc(documenters)
+            for documenter in documenters:
+                if documenter._client_module == package_path:
+                    yield ""
+                    yield str(documenter)
+
     ### PUBLIC PROPERTIES ###
 
     @property
     def member_documenters_by_section(self) -> List[Tuple[str, List[MemberDocumenter]]]:
-        result: MutableMapping[str, List[MemberDocumenter]] = {}
+        if self._member_documenters_by_section is not None:
+            return cast(
+                List[Tuple[str, List[MemberDocumenter]]],
+                self._member_documenters_by_section,
+            )
+        result: Dict[str, List[MemberDocumenter]] = collections.defaultdict(list)
         for documenter in self.member_documenters:
-            result.setdefault(documenter.documentation_section, []).append(documenter)
+            result[documenter.documentation_section].append(documenter)
         for module_documenter in self.module_documenters or []:
             if not module_documenter.is_nominative:
                 continue
             documenter = module_documenter.member_documenters[0]
-            result.setdefault(documenter.documentation_section, []).append(documenter)
-        return sorted(result.items())
+            result[documenter.documentation_section].append(documenter)
+        self._member_documenters_by_section = by_section = sorted(result.items())
+        return by_section
 
 
 class SummarizingRootDocumenter(RootDocumenter):
@@ -607,55 +596,34 @@ class SummarizingRootDocumenter(RootDocumenter):
     """
 
     def __str__(self):
-        result = [
-            self.title,
-            "=" * len(self.title),
-            "",
-            ".. toctree::",
-            "   :hidden:",
-            "",
-        ]
+        return "\n".join(self._iter_lines())
+
+    def _iter_lines(self) -> Iterator[str]:
+        yield self.title
+        yield "=" * len(self.title)
+        yield from _TOC_HEADER
         for documenter in self.module_documenters:
             path = documenter.package_path.replace(".", "/")
             if documenter.is_package:
                 path += "/index"
-            result.append("   {}".format(path))
+            yield "   {}".format(path)
         for module_documenter, documenters_by_section in self._recurse(self):
-            result.extend(
-                [
-                    "",
-                    ".. raw:: html",
-                    "",
-                    "   <hr/>",
-                    "",
-                    ".. rubric:: :ref:`{} <{}>`".format(
-                        module_documenter.package_path, module_documenter.reference_name
-                    ),
-                    "   :class: section-header",
-                ]
+            yield from _HR
+            yield ".. rubric:: :ref:`{} <{}>`".format(
+                module_documenter.package_path, module_documenter.reference_name
             )
+            yield "   :class: section-header"
             summary = self._extract_summary(module_documenter)
             if summary:
-                result.extend(["", summary])
+                yield ""
+                yield summary
             for section_name, documenters in documenters_by_section:
-                result.extend(
-                    [
-                        "",
-                        ".. raw:: html",
-                        "",
-                        "   <hr/>",
-                        "",
-                        ".. rubric:: {}".format(section_name),
-                        "   :class: subsection-header",
-                        "",
-                        ".. autosummary::",
-                        "   :nosignatures:",
-                        "",
-                    ]
-                )
+                yield from _HR
+                yield ".. rubric:: {}".format(section_name)
+                yield "   :class: subsection-header"
+                yield from _AUTOSUMMARY_HEADER
                 for documenter in documenters:
-                    result.append("   ~{}".format(documenter.package_path))
-        return "\n".join(result)
+                    yield "   ~{}".format(documenter.package_path)
 
     def _recurse(self, documenter):
         result = []
@@ -1,5 +1,4 @@
 import collections
-import copy
 import threading
 import typing
 from typing import Optional
@@ -27,6 +26,29 @@ class UniqueTreeNode:
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _batch_set_parent(cls, nodes, new_parent):
+        # Detach every node before re-parenting any, as a batch may hold a node
+        # alongside its own descendants; those descendants are batch members
+        # too, so merging names cached before detaching loses nothing, and the
+        # new parentage is walked once for the whole batch
+        name_dictionary = {}
+        for node in nodes:
+            old_parent = node._parent
+            named_children = node._cache_named_children()
+            node._remove_from_parent()
+            node._remove_named_children_from_parentage(old_parent, named_children)
+            for name, children in named_children.items():
+                if name in name_dictionary:
+                    name_dictionary[name].update(children)
+                else:
+                    name_dictionary[name] = children
+        for node in nodes:
+            node._parent = new_parent
+            if new_parent is None:
+                node._mark_entire_tree_for_later_update()
+        cls._restore_named_children_to_parentage(new_parent, name_dictionary)
+
     def _cache_named_children(self):
         name_dictionary = {}
         if self.name is not None:
@@ -58,7 +80,7 @@ class UniqueTreeNode:
 
     def _remove_from_parent(self):
         if self._parent is not None and self in self._parent:
-            self._parent._children.remove(self)
+            self._parent._remove_child(self)
         self._parent = None
 
     def _remove_named_children_from_parentage(self, old_parent, name_dictionary):
@@ -72,7 +94,8 @@ class UniqueTreeNode:
                 if not named_children[name]:
                     del named_children[name]
 
-    def _restore_named_children_to_parentage(self, new_parent, name_dictionary):
+    @classmethod
+    def _restore_named_children_to_parentage(cls, new_parent, name_dictionary):
         if new_parent is None or not name_dictionary:
             return
         for parent in new_parent.parentage:
@@ -81,17 +104,10 @@ class UniqueTreeNode:
                 if name in named_children:
                     named_children[name].update(name_dictionary[name])
                 else:
-                    named_children[name] = copy.copy(name_dictionary[name])
+                    named_children[name] = name_dictionary[name].copy()
 
     def _set_parent(self, new_parent):
-        old_parent = self._parent
-        named_children = self._cache_named_children()
-        self._remove_from_parent()
-        self._remove_named_children_from_parentage(old_parent, named_children)
-        self._parent = new_parent
-        self._restore_named_children_to_parentage(new_parent, named_children)
-        if new_parent is None:
-            self._mark_entire_tree_for_later_update()
+        self._batch_set_parent((self,), new_parent)
 
     ### PUBLIC PROPERTIES ###
 
@@ -200,8 +216,7 @@ class UniqueTreeContainer(UniqueTreeNode):
         return False
 
     def __iter__(self):
-        for child in self._children:
-            yield child
+        return iter(self._children)
 
     def __len__(self):
         return len(self._children)
@@ -212,9 +227,20 @@ class UniqueTreeContainer(UniqueTreeNode):
         name_dictionary = super()._cache_named_children()
         if hasattr(self, "_named_children"):
             for name, children in self._named_children.items():
-                name_dictionary[name] = copy.copy(children)
+                # A descendant may share this container's own name
+                if name in name_dictionary:
+                    name_dictionary[name].update(children)
+                else:
+                    name_dictionary[name] = children.copy()
         return name_dictionary
 
+    def _get_children(self, snapshot=True):
+        # Snapshot children unless the caller guarantees no mutation mid-walk
+        return tuple(self._children) if snapshot else self._children
+
+    def _remove_child(self, node):
+        self._children.remove(node)
+
     ### PRIVATE PROPERTIES ###
 
     @property
@@ -223,16 +249,28 @@ class UniqueTreeContainer(UniqueTreeNode):
 
     ### PUBLIC METHODS ###
 
-    def depth_first(self, top_down=True, prototype=None):
-        for child in tuple(self):
-            if top_down:
-                if not prototype or isinstance(child, prototype):
+    def depth_first(self, top_down=True, prototype=None, snapshot=True):
+        # Walk with an explicit stack of (container, children iterator) pairs
+        # rather than recursing, so deep trees cost no nested generator frames
+        stack = [(self, iter(self._get_children(snapshot)))]
+        while stack:
+            container, children = stack[-1]
+            for child in children:
+                if top_down and (not prototype or isinstance(child, prototype)):
                     yield child
-            if isinstance(child, UniqueTreeContainer):
-                yield from child.depth_first(top_down=top_down, prototype=prototype)
-            if not top_down:
-                if not prototype or isinstance(child, prototype):
+                if isinstance(child, UniqueTreeContainer):
+                    stack.append((child, iter(child._get_children(snapshot))))
+                    break
+                if not top_down and (not prototype or isinstance(child, prototype)):
                     yield child
+            else:
+                stack.pop()
+                if (
+                    not top_down
+                    and stack
+                    and (not prototype or isinstance(container, prototype))
+                ):
+                    yield container
 
     def recurse(self, prototype=None):
         return self.depth_first(prototype=prototype)
@@ -259,11 +297,20 @@ class UniqueTreeList(UniqueTreeContainer):
     def __init__(self, children=None, name=None):
         super().__init__(name=name)
         self._children = []
+        self._children_tuple = None
+        self._child_indices = {}
+        self._stale_index = 0
+        self._stale_index_scanned = False
         if children is not None:
-            self[:] = children
+            self._initialize_children(children)
 
     ### SPECIAL METHODS ###
 
+    def __contains__(self, expr):
+        if isinstance(expr, str):
+            return expr in self._named_children
+        return id(expr) in self._child_indices
+
     def __delitem__(self, i):
         if isinstance(i, str):
             children = tuple(self._named_children[i])
@@ -276,7 +323,6 @@ class UniqueTreeList(UniqueTreeContainer):
                 i = len(self) + i
             i = slice(i, i + 1)
         self.__setitem__(i, [])
-        self._mark_entire_tree_for_later_update()
 
     def __getitem__(self, expr):
         if isinstance(expr, (int, slice)):
@@ -288,6 +334,13 @@ class UniqueTreeList(UniqueTreeContainer):
             return result
         raise ValueError(expr)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Child indices are keyed by id() and do not survive copying or pickling
+        del state["_child_indices"]
+        state["_children_tuple"] = None
+        return state
+
     def __setitem__(self, i, new_items):
         if isinstance(i, int):
             new_items = self._prepare_setitem_single(new_items)
@@ -298,29 +351,90 @@ class UniqueTreeList(UniqueTreeContainer):
         old_items = self[start_index:stop_index]
         self._validate(new_items, old_items, start_index, stop_index)
         self._set_items(new_items, old_items, start_index, stop_index)
-        self._mark_entire_tree_for_later_update()
+        if new_items or old_items:
+            self._mark_entire_tree_for_later_update()
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._child_indices = {}
+        self._stale_index = 0
+        self._reindex_children()
 
     ### PRIVATE METHODS ###
 
+    def _initialize_children(self, children):
+        # A new list has no children to replace and no parentage beyond itself,
+        # so skip the slice bookkeeping __setitem__ performs
+        new_items = self._prepare_setitem_multiple(children)
+        self._validate(new_items, (), 0, 0)
+        self._set_items(new_items, (), 0, 0)
+        if new_items:
+            self._mark_entire_tree_for_later_update()
+
     def _prepare_setitem_multiple(self, expr):
         return list(expr)
 
     def _prepare_setitem_single(self, expr):
         return [expr]
 
+    def _mark_stale(self, index):
+        # Indices from here on may be out of date; index() refreshes them lazily
+        self._stale_index = min(self._stale_index, index)
+        self._stale_index_scanned = False
+        self._children_tuple = None
+
+    def _reindex_children(self):
+        child_indices = self._child_indices
+        children = self._children
+        for i in range(self._stale_index, len(children)):
+            child_indices[id(children[i])] = i
+        self._stale_index = len(children)
+
+    def _remove_child(self, node):
+        i = self._child_indices.pop(id(node))
+        if i >= self._stale_index:
+            i = self._scan_stale_children(node)
+        del self._children[i]
+        self._mark_stale(i)
+
+    def _scan_stale_children(self, node):
+        # Match by identity, as list.index() would defer to a node's __eq__
+        children = self._children
+        for i in range(self._stale_index, len(children)):
+            if children[i] is node:
+                return i
+        raise ValueError(node)
+
     def _set_items(self, new_items, old_items, start_index, stop_index):
-        for old_item in old_items:
-            old_item._set_parent(None)
-        for new_item in new_items:
-            new_item._set_parent(self)
-        self._children.__setitem__(slice(start_index, start_index), new_items)
+        children = self._children
+        child_indices = self._child_indices
+        if old_items:
+            # Drop the replaced slice at once, so detaching skips _remove_child
+            del children[start_index:stop_index]
+            for old_item in old_items:
+                del child_indices[id(old_item)]
+            self._mark_stale(start_index)
+            self._batch_set_parent(old_items, None)
+        if not new_items:
+            return
+        self._batch_set_parent(new_items, self)
+        # Re-parenting existing children may have shortened the list
+        start_index = min(start_index, len(children))
+        appending = start_index == len(children) == self._stale_index
+        children[start_index:start_index] = new_items
+        for i, new_item in enumerate(new_items, start_index):
+            child_indices[id(new_item)] = i
+        self._mark_stale(start_index)
+        if appending:
+            # Indices stay exact when only appending to an up-to-date map
+            self._stale_index = len(children)
 
     def _validate(self, new_nodes, old_nodes, start_index, stop_index):
-        parentage = self.parentage
+        parentage_ids = {id(node) for node in self.parentage}
         for new_node in new_nodes:
             if not isinstance(new_node, self._node_class):
                 raise ValueError(f"Expected {self._node_class}, got {type(new_node)}")
-            elif new_node in parentage:
+            elif id(new_node) in parentage_ids:
                 raise ValueError("Cannot set parent node as child.")
 
     ### PUBLIC METHODS ###
@@ -332,12 +446,20 @@ class UniqueTreeList(UniqueTreeContainer):
         self.__setitem__(slice(len(self), len(self)), expr)
 
     def index(self, expr):
-        for i, child in enumerate(self._children):
-            if child is expr:
-                return i
-        message = "{!r} not in {!r}."
-        message = message.format(expr, self)
-        raise ValueError(message)
+        i = self._child_indices.get(id(expr))
+        if i is None:
+            message = "{!r} not in {!r}."
+            message = message.format(expr, self)
+            raise ValueError(message)
+        elif i < self._stale_index:
+            return i
+        elif not self._stale_index_scanned:
+            # Scan once after a mutation, as callers like remove() mutate again
+            # straight away; only reindex if lookups repeat
+            self._stale_index_scanned = True
+            return self._scan_stale_children(expr)
+        self._reindex_children()
+        return self._child_indices[id(expr)]
 
     def insert(self, i, expr):
         self.__setitem__(slice(i, i), [expr])
@@ -351,6 +473,15 @@ class UniqueTreeList(UniqueTreeContainer):
         i = self.index(node)
         del self[i]
 
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def children(self):
+        # Cached until the next mutation, as children are often read repeatedly
+        if self._children_tuple is None:
+            self._children_tuple = tuple(self._children)
+        return self._children_tuple
+
 
 class UniqueTreeTuple(UniqueTreeContainer):
     """
@@ -388,7 +519,8 @@ class UniqueTreeTuple(UniqueTreeContainer):
         old_items = self[start_index:stop_index]
         self._validate(new_items, old_items, start_index, stop_index)
         self._set_items(new_items, old_items, start_index, stop_index)
-        self._mark_entire_tree_for_later_update()
+        if new_items or old_items:
+            self._mark_entire_tree_for_later_update()
 
     def _prepare_setitem_multiple(self, expr):
         return list(expr)
@@ -397,18 +529,16 @@ class UniqueTreeTuple(UniqueTreeContainer):
         return [expr]
 
     def _set_items(self, new_items, old_items, start_index, stop_index):
-        for old_item in old_items:
-            old_item._set_parent(None)
-        for new_item in new_items:
-            new_item._set_parent(self)
+        self._batch_set_parent(old_items, None)
+        self._batch_set_parent(new_items, self)
         self._children.__setitem__(slice(start_index, start_index), new_items)
 
     def _validate(self, new_nodes, old_nodes, start_index, stop_index):
-        parentage = self.parentage
+        parentage_ids = {id(node) for node in self.parentage}
         for new_node in new_nodes:
             if not isinstance(new_node, self._node_class):
                 raise ValueError(f"Expected {self._node_class}, got {type(new_node)}")
-            elif new_node in parentage:
+            elif id(new_node) in parentage_ids:
                 raise ValueError("Cannot set parent node as child.")
 
     ### PUBLIC METHODS ###
@@ -445,18 +575,16 @@ class UniqueTreeSet(UniqueTreeContainer):
             self._mark_entire_tree_for_later_update()
 
     def _update_parentage(self, new_nodes, old_nodes):
-        for old_node in old_nodes:
-            old_node._set_parent(None)
-        for new_node in new_nodes:
-            new_node._set_parent(self)
+        self._batch_set_parent(old_nodes, None)
+        self._batch_set_parent(new_nodes, self)
         self._children.update(new_nodes)
 
     def _validate(self, new_nodes):
-        parentage = self.parentage
+        parentage_ids = {id(node) for node in self.parentage}
         for new_node in new_nodes:
             if not isinstance(new_node, self._node_class):
                 raise ValueError(f"Expected {self._node_class}, got {type(new_node)}")
-            elif new_node in parentage:
+            elif id(new_node) in parentage_ids:
                 raise ValueError("Cannot set parent node as child.")
 
     ### PUBLIC METHODS ###
@@ -518,6 +646,9 @@ class UniqueTreeDict(UniqueTreeContainer):
 
     ### PRIVATE METHODS ###
 
+    def _get_children(self, snapshot=True):
+        return tuple(self.values()) if snapshot else self.values()
+
     def _mutate(self, new_items, old_items):
         with self._lock:
             self._validate(new_items, old_items)
@@ -548,17 +679,15 @@ class UniqueTreeDict(UniqueTreeContainer):
         return new_nodes, old_nodes
 
     def _update_parentage(self, new_nodes, old_nodes):
-        for old_node in old_nodes:
-            old_node._set_parent(None)
-        for new_node in new_nodes:
-            new_node._set_parent(self)
+        self._batch_set_parent(old_nodes, None)
+        self._batch_set_parent(new_nodes, self)
 
     def _validate(self, new_items, old_items):
-        parentage = self.parentage
+        parentage_ids = {id(node) for node in self.parentage}
         for _, new_node in new_items:
             if not isinstance(new_node, self._node_class):
                 raise ValueError(f"Expected {self._node_class}, got {type(new_node)}")
-            elif new_node in parentage:
+            elif id(new_node) in parentage_ids:
                 raise ValueError("Cannot set parent node as child.")
 
     ### PUBLIC METHODS ###
@@ -566,15 +695,6 @@ class UniqueTreeDict(UniqueTreeContainer):
     def clear(self):
         self._mutate([], list(self.items()))
 
-    def depth_first(self, top_down=True):
-        for child in tuple(self.values()):
-            if top_down:
-                yield child
-            if isinstance(child, UniqueTreeContainer):
-                yield from child.depth_first(top_down=top_down)
-            if not top_down:
-                yield child
-
     def get(self, key, default=None):
         return self._children.get(key, default)
 
@@ -591,9 +711,6 @@ class UniqueTreeDict(UniqueTreeContainer):
             self._mutate([], [(args[0], value)])
             return value
 
-    def recurse(self):
-        return self.depth_first()
-
     def update(*args, **kwargs):
         self, *args = args
         if len(args) > 1:
@@ -2,12 +2,27 @@
 Tools for building Graphviz graphs.
 """
 
+from typing import TYPE_CHECKING
+
 from .attrs import Attributes
 from .core import Attachable, Edge, Graph, Node
-from .graphers import Grapher
 from .html import HRule, LineBreak, Table, TableCell, TableRow, Text, VRule
 from .records import RecordField, RecordGroup
 
+if TYPE_CHECKING:
+    from .graphers import Grapher
+
+
+def __getattr__(name):
+    # Grapher pulls in uqbar.io and subprocess machinery, so load it on demand
+    if name == "Grapher":
+        from .graphers import Grapher
+
+        globals()["Grapher"] = Grapher
+        return Grapher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "Attachable",
     "Attributes",
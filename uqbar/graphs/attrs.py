@@ -1,8 +1,9 @@
 import collections.abc
 import enum
+import functools
 import math
 import re
-from typing import Any, FrozenSet, Mapping, Optional, Union
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple, Union
 
 
 class Attributes(collections.abc.MutableMapping):
@@ -32,6 +33,8 @@ class Attributes(collections.abc.MutableMapping):
 
     ### CLASS VARIABLES ###
 
+    __slots__ = ("_attributes", "_mode")
+
     class Color(object):
         __slots__ = ("color",)
 
@@ -69,7 +72,7 @@ class Attributes(collections.abc.MutableMapping):
     __documentation_section__ = "Core Classes"
 
     _arrow_types = frozenset(
-        [
+        {
             "box",
             "circle",
             "crow",
@@ -90,27 +93,27 @@ class Attributes(collections.abc.MutableMapping):
             "open",
             "tee",
             "vee",
-        ]
+        }
     )
 
-    _cluster_modes = frozenset(["global", "local", "none"])
+    _cluster_modes = frozenset({"global", "local", "none"})
 
-    _dir_types = frozenset(["back", "both", "forward", "none"])
+    _dir_types = frozenset({"back", "both", "forward", "none"})
 
-    _output_modes = frozenset(["breadthfirst", "nodesfirst", "edgesfirst"])
+    _output_modes = frozenset({"breadthfirst", "nodesfirst", "edgesfirst"})
 
-    _pack_modes = frozenset(["node", "clust", "graph"])
+    _pack_modes = frozenset({"node", "clust", "graph"})
 
-    _page_dirs = frozenset(["BL", "BR", "LB", "LT", "RB", "RT", "TL", "TR"])
+    _page_dirs = frozenset({"BL", "BR", "LB", "LT", "RB", "RT", "TL", "TR"})
 
-    _quad_types = frozenset(["fast", "none", "normal"])
+    _quad_types = frozenset({"fast", "none", "normal"})
 
-    _rank_types = frozenset(["max", "min", "same", "sink", "source"])
+    _rank_types = frozenset({"max", "min", "same", "sink", "source"})
 
-    _rank_dirs = frozenset(["BT", "LR", "RL", "TB"])
+    _rank_dirs = frozenset({"BT", "LR", "RL", "TB"})
 
     _shapes = frozenset(
-        [
+        {
             "Mcircle",
             "Mdiamond",
             "Msquare",
@@ -172,11 +175,11 @@ class Attributes(collections.abc.MutableMapping):
             "utr",
             "record",
             "Mrecord",
-        ]
+        }
     )
 
     _smooth_types = frozenset(
-        ["avg_dist", "graph_dist", "none", "power_dist", "rng", "spring", "triangle"]
+        {"avg_dist", "graph_dist", "none", "power_dist", "rng", "spring", "triangle"}
     )
 
     _styles: FrozenSet[str] = frozenset()
@@ -186,7 +189,7 @@ class Attributes(collections.abc.MutableMapping):
     ### GRAPH OBJECT SPECIFICS ###
 
     _cluster_attributes = frozenset(
-        [
+        {
             "K",
             "URL",
             "area",
@@ -217,15 +220,15 @@ class Attributes(collections.abc.MutableMapping):
             "style",
             "target",
             "tooltip",
-        ]
+        }
     )
 
     _cluster_styles = frozenset(
-        ["bold", "dashed", "dotted", "filled", "rounded", "solid", "striped"]
+        {"bold", "dashed", "dotted", "filled", "rounded", "solid", "striped"}
     )
 
     _edge_attributes = frozenset(
-        [
+        {
             "arrowhead",
             "arrowsize",
             "arrowtail",
@@ -288,13 +291,13 @@ class Attributes(collections.abc.MutableMapping):
             "target",
             "tooltip",
             "weight",
-        ]
+        }
     )
 
-    _edge_styles = frozenset(["bold", "dashed", "dotted", "solid"])
+    _edge_styles = frozenset({"bold", "dashed", "dotted", "solid"})
 
     _graph_attributes = frozenset(
-        [
+        {
             "Damping",
             "K",
             "URL",
@@ -395,13 +398,13 @@ class Attributes(collections.abc.MutableMapping):
             "xlabel",
             "xlp",
             "penwidth",
-        ]
+        }
     )
 
     _graph_styles = _cluster_styles
 
     _node_attributes = frozenset(
-        [
+        {
             "URL",
             "area",
             "color",
@@ -448,11 +451,11 @@ class Attributes(collections.abc.MutableMapping):
             "vertixes",
             "width",
             "z",
-        ]
+        }
     )
 
     _node_styles = frozenset(
-        [
+        {
             "solid",
             "dashed",
             "dotted",
@@ -462,13 +465,13 @@ class Attributes(collections.abc.MutableMapping):
             "filled",
             "striped",
             "wedged",
-        ]
+        }
     )
 
     ### HTML OBJECT SPECIFICS ###
 
     _table_attributes = frozenset(
-        [
+        {
             "align",
             "bgcolor",
             "border",
@@ -490,11 +493,11 @@ class Attributes(collections.abc.MutableMapping):
             "tooltip",
             "valign",
             "width",
-        ]
+        }
     )
 
     _table_cell_attributes = frozenset(
-        [
+        {
             "align",
             "balign",
             "bgcolor",
@@ -516,13 +519,35 @@ class Attributes(collections.abc.MutableMapping):
             "tooltip",
             "valign",
             "width",
-        ]
+        }
     )
 
+    _attributes_and_styles_by_mode = {
+        Mode.CLUSTER: (_cluster_attributes, _cluster_styles),
+        Mode.EDGE: (_edge_attributes, _edge_styles),
+        Mode.GRAPH: (_graph_attributes, _graph_styles),
+        Mode.NODE: (_node_attributes, _node_styles),
+        Mode.TABLE: (_table_attributes, _styles),
+        Mode.TABLE_CELL: (_table_cell_attributes, _styles),
+    }
+
     ### VALIDATORS ###
 
+    _cacheable_types = frozenset({bool, float, int, str})
+
+    _uncacheable_keys: Optional[FrozenSet[str]] = None
+
     _validators: Optional[Mapping[str, object]] = None
 
+    _validator_chain_cache: Dict[
+        Tuple[FrozenSet[str], Optional[Callable]],
+        Tuple[FrozenSet[str], Optional[Callable]],
+    ] = {}
+
+    _validator_chains: Optional[
+        Dict["Attributes.Mode", Dict[str, Tuple[FrozenSet[str], Optional[Callable]]]]
+    ] = None
+
     ### INITIALIZER ###
 
     def __init__(self, mode: Union[str, "Attributes.Mode"], **kwargs) -> None:
@@ -533,6 +558,9 @@ class Attributes(collections.abc.MutableMapping):
 
     ### SPECIAL METHODS ###
 
+    def __contains__(self, key) -> bool:
+        return key in self._attributes
+
     def __delitem__(self, key: str) -> None:
         del self._attributes[key]
 
@@ -553,19 +581,15 @@ class Attributes(collections.abc.MutableMapping):
     def __format_graphviz__(self) -> str:
         if not self._attributes:
             return ""
-        result = []
-        attributes = sorted(self._attributes.items())
-        for i, (key, value) in enumerate(attributes, 1):
-            value = self._format_value(value).split("\n")
-            value[0] = "{}={}".format(key, value[0])
-            if i < len(attributes):
-                value[-1] += ","
-            if i == 1:
-                result.append(value.pop(0))
-            result.extend("    " + _ for _ in value)
-        result[0] = "[" + result[0]
-        result[-1] = result[-1] + "];"
-        return "\n".join(result)
+        format_value = self._format_value
+        result = ",\n".join(
+            [
+                "{}={}".format(key, format_value(value))
+                for key, value in sorted(self._attributes.items())
+            ]
+        )
+        # every line but the first is indented, including multi-line values
+        return "[{}];".format(result.replace("\n", "\n    "))
 
     def __format_html__(self) -> str:
         if not self._attributes:
@@ -593,6 +617,13 @@ class Attributes(collections.abc.MutableMapping):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _check_enum(cls, value, valid_values=None, **kwargs):
+        value = str(value)
+        if value not in valid_values:
+            raise ValueError(value)
+        return value
+
     @classmethod
     def _format_value(cls, value) -> str:
         if isinstance(value, bool):
@@ -625,48 +656,39 @@ class Attributes(collections.abc.MutableMapping):
         raise ValueError(value)
 
     @classmethod
-    def _validate_arrow_type(cls, value, **kwargs):
-        value = str(value)
-        assert value in cls._arrow_types
-        return value
+    def _validate_attributes(cls, mode, **kwargs):
+        if not kwargs:
+            return {}
+        if cls._get_uncacheable_keys(mode).isdisjoint(kwargs) and all(
+            type(value) in cls._cacheable_types for value in kwargs.values()
+        ):
+            # key on type too, so that 1, 1.0 and True stay distinct
+            items = tuple((key, type(value), value) for key, value in kwargs.items())
+            return dict(cls._validate_cacheable_attributes(mode, items))
+        return cls._validate_attribute_items(mode, kwargs.items())
 
     @classmethod
-    def _validate_attributes(cls, mode, **kwargs):
-        valid_attributes, valid_styles = {
-            cls.Mode.CLUSTER: (cls._cluster_attributes, cls._cluster_styles),
-            cls.Mode.EDGE: (cls._edge_attributes, cls._edge_styles),
-            cls.Mode.GRAPH: (cls._graph_attributes, cls._graph_styles),
-            cls.Mode.NODE: (cls._node_attributes, cls._node_styles),
-            cls.Mode.TABLE: (cls._table_attributes, ()),
-            cls.Mode.TABLE_CELL: (cls._table_cell_attributes, ()),
-        }[mode]
+    def _validate_attribute_items(cls, mode, items):
+        validator_chains = cls._get_validator_chains(mode)
         attributes = {}
-        for key, value in kwargs.items():
-            if key not in valid_attributes:
+        for key, value in items:
+            validator_chain = validator_chains.get(key)
+            if validator_chain is None:
                 raise ValueError(key)
-            validators = cls._get_validators(mode)[key]
-            if not isinstance(validators, tuple):
-                validators = (validators,)
-            for validator in validators:
-                if isinstance(validator, str):
-                    if str(value) == validator:
-                        value = str(value)
-                        break
-                    continue
-                elif isinstance(validator, type):
-                    value = validator(value)
-                    break
-                else:
-                    value = validator(value, valid_styles=valid_styles)
-                    break
+            literals, converter = validator_chain
+            if literals and str(value) in literals:
+                value = str(value)
+            elif converter is not None:
+                value = converter(value)
             attributes[key] = value
         return attributes
 
     @classmethod
-    def _validate_cluster_mode(cls, value, **kwargs):
-        value = str(value)
-        assert value in cls._cluster_modes
-        return value
+    @functools.lru_cache(maxsize=1024)
+    def _validate_cacheable_attributes(cls, mode, items):
+        return cls._validate_attribute_items(
+            mode, ((key, value) for key, _, value in items)
+        )
 
     @classmethod
     def _validate_color(cls, value, **kwargs):
@@ -679,40 +701,21 @@ class Attributes(collections.abc.MutableMapping):
     def _validate_colors(cls, value, **kwargs):
         if isinstance(value, (cls.Color, int, str)):
             return cls._validate_color(value, **kwargs)
-        assert len(value)
-        value = tuple(cls._validate_color(_, **kwargs) for _ in value)
+        if not len(value):
+            raise ValueError(value)
+        color_class = cls.Color
+        value = tuple(
+            [_ if isinstance(_, color_class) else color_class(_) for _ in value]
+        )
         if len(value) == 1:
             return value[0]
         return value
 
-    @classmethod
-    def _validate_dir_type(cls, value, **kwargs):
-        value = str(value)
-        assert value in cls._dir_types
-        return value
-
     @classmethod
     def _validate_floats(cls, value, **kwargs):
-        assert len(value)
-        return tuple(float(_) for _ in value)
-
-    @classmethod
-    def _validate_output_mode(cls, value, **kwargs):
-        value = str(value)
-        assert value in cls._output_modes
-        return value
-
-    @classmethod
-    def _validate_pack_mode(cls, value, **kwargs):
-        value = str(value)
-        assert value in cls._pack_modes
-        return value
-
-    @classmethod
-    def _validate_page_dir(cls, value, **kwargs):
-        value = str(value)
-        assert value in cls._page_dirs
-        return value
+        if not len(value):
+            raise ValueError(value)
+        return tuple([float(_) for _ in value])
 
     @classmethod
     def _validate_point(cls, value, **kwargs):
@@ -723,64 +726,56 @@ class Attributes(collections.abc.MutableMapping):
 
     @classmethod
     def _validate_points(cls, value_list, **kwargs):
-        assert value_list
-        return tuple(cls._validate_point(_, **kwargs) for _ in value_list)
-
-    @classmethod
-    def _validate_quad_type(cls, value, **kwargs):
-        value = str(value)
-        assert value in cls._quad_types
-        return value
-
-    @classmethod
-    def _validate_rank_dir(cls, value, **kwargs):
-        value = str(value)
-        assert value in cls._rank_dirs
-        return value
-
-    @classmethod
-    def _validate_rank_type(cls, value, **kwargs):
-        value = str(value)
-        assert value in cls._rank_types
-        return value
+        if not value_list:
+            raise ValueError(value_list)
+        point_class = cls.Point
+        return tuple(
+            [_ if isinstance(_, point_class) else point_class(*_) for _ in value_list]
+        )
 
     @classmethod
     def _validate_rect(cls, value, **kwargs):
-        assert len(value) == 4
+        if len(value) != 4:
+            raise ValueError(value)
         value = tuple(float(_) for _ in value)
         return value
 
-    @classmethod
-    def _validate_shape(cls, value, **kwargs):
-        value = str(value)
-        assert value in cls._shapes
-        return value
-
-    @classmethod
-    def _validate_smooth_type(cls, value, **kwargs):
-        value = str(value)
-        assert value in cls._smooth_types
-        return value
-
     @classmethod
     def _validate_style(cls, value, valid_styles=None, **kwargs):
-        value = str(value)
-        assert value in valid_styles
-        return value
+        return cls._check_enum(value, valid_values=valid_styles)
 
     @classmethod
     def _validate_styles(cls, value, valid_styles=None, **kwargs):
         if isinstance(value, str):
             return cls._validate_style(value, valid_styles=valid_styles, **kwargs)
-        assert value
-        return tuple(
-            cls._validate_style(_, valid_styles=valid_styles, **kwargs) for _ in value
-        )
+        if not value:
+            raise ValueError(value)
+        value = tuple([str(_) for _ in value])
+        for style in value:
+            if style not in valid_styles:
+                raise ValueError(style)
+        return value
 
     ### PUBLIC METHODS ###
 
     def copy(self):
-        return type(self)(self.mode, **self._attributes.copy())
+        # already validated, so bypass __init__
+        copied = type(self).__new__(type(self))
+        copied._mode = self._mode
+        copied._attributes = dict(self._attributes)
+        return copied
+
+    def get(self, key, default=None) -> Any:
+        return self._attributes.get(key, default)
+
+    def items(self):
+        return self._attributes.items()
+
+    def keys(self):
+        return self._attributes.keys()
+
+    def values(self):
+        return self._attributes.values()
 
     ### PUBLIC PROPERTIES ###
 
@@ -788,6 +783,78 @@ class Attributes(collections.abc.MutableMapping):
     def mode(self):
         return self._mode
 
+    @classmethod
+    def _get_validator_chains(cls, mode):
+        """
+        Get validator chains for ``mode``, keyed by valid attribute name.
+
+        Each chain is a pair of a frozenset of accepted string literals and an
+        optional single-argument converter. Only the style validators are
+        pre-bound with the mode's valid styles. Anything after the first
+        non-literal validator is dropped, as it could never be reached.
+        Identical chains are shared, within and across modes.
+        """
+        if cls._validator_chains is None:
+            cls._validator_chains = {}
+        if mode not in cls._validator_chains:
+            valid_attributes, valid_styles = cls._attributes_and_styles_by_mode[mode]
+            validators_by_key = cls._get_validators(mode)
+            style_validators = (
+                cls._validate_style.__func__,
+                cls._validate_styles.__func__,
+            )
+            validator_chains = {}
+            for key in valid_attributes:
+                if key not in validators_by_key:
+                    continue
+                validators = validators_by_key[key]
+                if not isinstance(validators, tuple):
+                    validators = (validators,)
+                literals = []
+                converter = None
+                for validator in validators:
+                    if isinstance(validator, str):
+                        literals.append(validator)
+                        continue
+                    elif getattr(validator, "__func__", None) in style_validators:
+                        converter = functools.partial(
+                            validator, valid_styles=valid_styles
+                        )
+                    else:
+                        converter = validator
+                    break
+                validator_chain = (frozenset(literals), converter)
+                validator_chains[key] = cls._validator_chain_cache.setdefault(
+                    validator_chain, validator_chain
+                )
+            cls._validator_chains[mode] = validator_chains
+        return cls._validator_chains[mode]
+
+    @classmethod
+    def _get_uncacheable_keys(cls, mode):
+        """
+        Get keys whose validators may build ``Color`` or ``Point`` instances.
+
+        Those are mutable, so validated values for these keys must never be
+        shared between attributes via the validation cache.
+        """
+        if cls._uncacheable_keys is None:
+            builders = (
+                cls._validate_color.__func__,
+                cls._validate_colors.__func__,
+                cls._validate_point.__func__,
+                cls._validate_points.__func__,
+            )
+            uncacheable_keys = set()
+            for key, validators in cls._get_validators(mode).items():
+                if not isinstance(validators, tuple):
+                    validators = (validators,)
+                for validator in validators:
+                    if getattr(validator, "__func__", None) in builders:
+                        uncacheable_keys.add(key)
+            cls._uncacheable_keys = frozenset(uncacheable_keys)
+        return cls._uncacheable_keys
+
     @classmethod
     def _get_validators(cls, mode):
         if not cls._validators:
@@ -798,9 +865,13 @@ class Attributes(collections.abc.MutableMapping):
                 "_background": str,
                 "align": ("center", "left", "right", "text"),
                 "area": float,
-                "arrowhead": Attributes._validate_arrow_type,
+                "arrowhead": functools.partial(
+                    Attributes._check_enum, valid_values=Attributes._arrow_types
+                ),
                 "arrowsize": float,
-                "arrowtail": Attributes._validate_arrow_type,
+                "arrowtail": functools.partial(
+                    Attributes._check_enum, valid_values=Attributes._arrow_types
+                ),
                 "balign": ("center", "left", "right", "text"),
                 "bb": Attributes._validate_rect,
                 "bgcolor": Attributes._validate_colors,
@@ -810,7 +881,9 @@ class Attributes(collections.abc.MutableMapping):
                 "cellspacing": float,
                 "center": bool,
                 "charset": str,
-                "clusterrank": Attributes._validate_cluster_mode,
+                "clusterrank": functools.partial(
+                    Attributes._check_enum, valid_values=Attributes._cluster_modes
+                ),
                 "color": Attributes._validate_colors,
                 "colorscheme": str,
                 "colspan": int,
@@ -823,7 +896,9 @@ class Attributes(collections.abc.MutableMapping):
                 "defaultdist": float,
                 "dim": int,
                 "dimen": int,
-                "dir": Attributes._validate_dir_type,
+                "dir": functools.partial(
+                    Attributes._check_enum, valid_values=Attributes._dir_types
+                ),
                 "diredgeconstraints": ("hier", bool),
                 "distortion": float,
                 "dpi": float,
@@ -904,24 +979,39 @@ class Attributes(collections.abc.MutableMapping):
                 "nslimit": float,
                 "nslimit1": float,
                 "ordering": str,
-                "outputorder": Attributes._validate_output_mode,
+                "outputorder": functools.partial(
+                    Attributes._check_enum, valid_values=Attributes._output_modes
+                ),
                 "overlap": ("scale", "scalexy", "compress", "ipsep", "prism", bool),
                 "overlap_scaling": float,
                 "overlap_shrink": bool,
                 "pack": bool,
-                "packmode": Attributes._validate_pack_mode,
+                "packmode": functools.partial(
+                    Attributes._check_enum, valid_values=Attributes._pack_modes
+                ),
                 "pad": (float, Attributes._validate_point),
                 "page": (float, Attributes._validate_point),
-                "pagedir": Attributes._validate_page_dir,
+                "pagedir": functools.partial(
+                    Attributes._check_enum, valid_values=Attributes._page_dirs
+                ),
                 "pencolor": Attributes._validate_color,
                 "penwidth": float,
                 "peripheries": int,
                 "pin": bool,
                 "pos": Attributes._validate_point,
-                "quadtree": (Attributes._validate_quad_type, bool),
+                "quadtree": (
+                    functools.partial(
+                        Attributes._check_enum, valid_values=Attributes._quad_types
+                    ),
+                    bool,
+                ),
                 "quantum": float,
-                "rank": Attributes._validate_rank_type,
-                "rankdir": Attributes._validate_rank_dir,
+                "rank": functools.partial(
+                    Attributes._check_enum, valid_values=Attributes._rank_types
+                ),
+                "rankdir": functools.partial(
+                    Attributes._check_enum, valid_values=Attributes._rank_dirs
+                ),
                 "ranksep": (float, Attributes._validate_floats),
                 "ratio": ("fill", "compress", "expand", "auto", float),
                 "rects": Attributes._validate_rect,
@@ -940,13 +1030,17 @@ class Attributes(collections.abc.MutableMapping):
                 "scale": (float, Attributes._validate_point),
                 "searchsize": int,
                 "sep": (float, Attributes._validate_point),
-                "shape": Attributes._validate_shape,
+                "shape": functools.partial(
+                    Attributes._check_enum, valid_values=Attributes._shapes
+                ),
                 "shapefile": str,
                 "showboxes": int,
                 "sides": (int, str),
                 "size": (float, Attributes._validate_point),
                 "skew": float,
-                "smoothing": Attributes._validate_smooth_type,
+                "smoothing": functools.partial(
+                    Attributes._check_enum, valid_values=Attributes._smooth_types
+                ),
                 "sortv": int,
                 "splines": (
                     "none",
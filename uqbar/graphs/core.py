@@ -159,7 +159,7 @@ class Graph(UniqueTreeList):
             return result
 
         all_edges: Set[Edge] = set()
-        for child in self.depth_first():
+        for child in self.depth_first(snapshot=False):
             for edge in getattr(child, "edges", ()):
                 if edge.tail.root is not edge.head.root:
                     continue